@@ -3,10 +3,24 @@
 Run all test cases and save outputs to the outputs directory.
 """
 
-import subprocess
+import argparse
+import json
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent / "src"))
+
+from dotenv import load_dotenv
+
+from converter import UniversalTextToJSONConverter
+from pdf_handler import PDFHandler
+
+# Load environment variables
+load_dotenv()
+
 # Test cases configuration
 TEST_CASES = [
     {
@@ -41,46 +55,69 @@ TEST_CASES = [
     }
 ]
 
-def run_test_case(test):
-    """Run a single test case."""
-    print(f"\n{'='*60}")
-    print(f"Running: {test['name']}")
-    print(f"{'='*60}")
-    
-    cmd = [
-        sys.executable,
-        "main.py",
-        "convert",
-        test["input"],
-        test["schema"],
-        "-o", test["output"],
-        "--no-show"
-    ]
-    
+def run_test_case(test, text, converter):
+    """Convert a test case's already-read input and return (success, message)."""
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode == 0:
-            print(f"✅ SUCCESS: Output saved to {test['output']}")
-        else:
-            print(f"❌ FAILED: {result.stderr}")
-            print(f"Stdout: {result.stdout}")
+        result = converter.convert(text, test["schema"], quiet=True)
+        payload = json.dumps(result, indent=2, ensure_ascii=False)
+        Path(test["output"]).write_text(payload, encoding="utf-8")
+        return True, f"✅ SUCCESS: Output saved to {test['output']}"
     except Exception as e:
-        print(f"❌ ERROR: {str(e)}")
+        return False, f"❌ ERROR: {str(e)}"
+
+def report(test, message):
+    """Print the outcome of one test case."""
+    print(f"\n{'='*60}")
+    print(f"Finished: {test['name']}")
+    print(f"{'='*60}")
+    print(message)
 
 def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(len(TEST_CASES), os.cpu_count() or 1),
+        help="Number of test cases to run at once (default: min(test count, CPU count))",
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    
     # Create outputs directory
     Path("outputs").mkdir(exist_ok=True)
     
     print("Running all test cases...")
     
-    # Run all tests
-    success_count = 0
+    # One converter shared by every test case
+    try:
+        converter = UniversalTextToJSONConverter()
+    except ValueError as e:
+        print(f"❌ ERROR: {str(e)}")
+        sys.exit(1)
+    
+    # Read all inputs first, on this thread: PyMuPDF is not thread safe, so
+    # PDFs must not be extracted concurrently from the worker threads
+    inputs = []
     for test in TEST_CASES:
         try:
-            run_test_case(test)
-            success_count += 1
-        except:
-            pass
+            inputs.append((test, PDFHandler.load_input(Path(test["input"]))))
+        except Exception as e:
+            report(test, f"❌ ERROR: {str(e)}")
+    
+    # Run the conversions on one pool - each one is blocked on the OpenAI API,
+    # so threads are enough and the shared converter needs no pickling
+    success_count = 0
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        futures = {
+            executor.submit(run_test_case, test, text, converter): test
+            for test, text in inputs
+        }
+        for future in as_completed(futures):
+            success, message = future.result()
+            report(futures[future], message)
+            if success:
+                success_count += 1
     
     print(f"\n{'='*60}")
     print(f"Summary: {success_count}/{len(TEST_CASES)} tests completed successfully")
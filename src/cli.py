@@ -8,26 +8,60 @@ following any schema.
 import typer
 from pathlib import Path
 import json
-from rich.console import Console
-from rich.table import Table
-from rich.syntax import Syntax
-from rich.panel import Panel
+import functools
 from typing import Optional
-import os
-from dotenv import load_dotenv
 
-from converter import UniversalTextToJSONConverter
-from pdf_handler import PDFHandler
+from console import get_console
 
-# Load environment variables
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+# rich, dotenv, the converter (instructor/openai) and the PDF libraries are
+# imported inside the commands that need them to keep CLI startup fast.
+
+# Outputs larger than this (in characters) are displayed without syntax highlighting
+SYNTAX_HIGHLIGHT_LIMIT = 200_000
+
+# Schemas with more top-level fields than this are listed without a table
+VALIDATE_TABLE_LIMIT = 200
 
 app = typer.Typer(
     name="text2json",
     help="Convert unstructured text to JSON following any schema",
     add_completion=False,
 )
-console = Console()
+
+
+@app.callback()
+def main():
+    """Convert unstructured text to JSON following any schema."""
+    from dotenv import load_dotenv
+    
+    # Load environment variables before command options read them
+    load_dotenv()
+
+
+@functools.lru_cache(maxsize=None)
+def get_header(title: str, subtitle: Optional[str] = None):
+    """Return a command's header Panel, built once per process."""
+    from rich.panel import Panel
+    
+    text = f"[bold blue]{title}[/bold blue]"
+    if subtitle:
+        text += f"\n[dim]{subtitle}[/dim]"
+    return Panel.fit(text, border_style="blue")
+
+
+def dump_json(data: dict, pretty: bool = True) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+        except TypeError:  # e.g. integers orjson cannot represent
+            pass
+    return json.dumps(data, indent=2 if pretty else None, ensure_ascii=False).encode("utf-8")
 
 
 @app.command()
@@ -86,12 +120,18 @@ def convert(
         text2json resume.txt resume_schema.json -o resume.json
         text2json --model gpt-4-turbo input.txt schema.json
     """
+    from rich.syntax import Syntax
+    from rich.table import Table
+    from converter import UniversalTextToJSONConverter
+    from pdf_handler import PDFHandler  # PDF libraries load only for PDF inputs
+    
+    console = get_console()
+    
     # Display header
     console.print(
-        Panel.fit(
-            "[bold blue]Universal Text-to-JSON Converter[/bold blue]\n"
-            "[dim]Converting unstructured text to structured JSON[/dim]",
-            border_style="blue",
+        get_header(
+            "Universal Text-to-JSON Converter",
+            "Converting unstructured text to structured JSON",
         )
     )
     
@@ -107,21 +147,8 @@ def convert(
         # Read input text
         console.print("[dim]Reading input file...[/dim]")
         
-        # Check if input is PDF
-        if PDFHandler.is_pdf(input_file):
-            console.print("[dim]Detected PDF file, extracting text...[/dim]")
-            text = PDFHandler.extract_text(input_file)
-            
-            # Apply preprocessing based on file name hints
-            if "resume" in str(input_file).lower() or "cv" in str(input_file).lower():
-                console.print("[dim]Applying resume preprocessing...[/dim]")
-                text = PDFHandler.preprocess_resume(text)
-            elif "paper" in str(input_file).lower() or "article" in str(input_file).lower():
-                console.print("[dim]Applying academic paper preprocessing...[/dim]")
-                text = PDFHandler.preprocess_academic_paper(text)
-        else:
-            text = input_file.read_text(encoding="utf-8")
-            
+        text = PDFHandler.load_input(input_file)
+        
         console.print(f"[green]✓[/green] Read {len(text):,} characters")
         
         # Initialize converter
@@ -137,20 +164,22 @@ def convert(
         
         # Save output
         console.print(f"\n[dim]Saving to {output_file}...[/dim]")
-        with open(output_file, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(result, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(result, f, ensure_ascii=False)
+        payload = dump_json(result, pretty)
+        output_file.write_bytes(payload)
         
         console.print(f"[green]✓[/green] Output saved to [bold]{output_file}[/bold]")
         
         # Display output if requested
         if show_output:
             console.print("\n[bold]Output:[/bold]")
-            json_str = json.dumps(result, indent=2, ensure_ascii=False)
-            syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
-            console.print(syntax)
+            # Reuse the saved payload; only compact output needs re-indenting
+            json_str = (payload if pretty else dump_json(result)).decode("utf-8")
+            if len(json_str) < SYNTAX_HIGHLIGHT_LIMIT:
+                syntax = Syntax(json_str, "json", theme="monokai", line_numbers=True)
+                console.print(syntax)
+            else:
+                # Pygments tokenization dominates for large outputs, print as is
+                console.out(json_str, highlight=False)
         
     except FileNotFoundError as e:
         console.print(f"[red]Error:[/red] {e}")
@@ -183,17 +212,16 @@ def validate(
     Example:
         text2json validate schema.json
     """
-    console.print(
-        Panel.fit(
-            "[bold blue]Schema Validator[/bold blue]",
-            border_style="blue",
-        )
-    )
+    from rich.table import Table
+    
+    console = get_console()
+    
+    console.print(get_header("Schema Validator"))
     
     try:
-        # Load and parse schema
-        with open(schema_file) as f:
-            schema = json.load(f)
+        # Load and parse schema; validate runs once per process, so the file is
+        # read directly rather than through the converter's schema cache
+        schema = json.loads(schema_file.read_bytes())
         
         # Basic validation
         if "properties" not in schema:
@@ -208,8 +236,27 @@ def validate(
         console.print(f"Total fields: {len(properties)}")
         console.print(f"Required fields: {len(required)}")
         
-        # Display fields table
-        if properties:
+        # Build all field rows up front
+        required_set = set(required)
+        rows = []
+        for name, prop in properties.items():
+            field_type = prop.get("type", "unknown")
+            is_required = "✓" if name in required_set else ""
+            desc = prop.get("description", "")
+            description = desc[:50] + ("..." if len(desc) > 50 else "")
+            rows.append((name, field_type, is_required, description))
+        
+        # Display fields table, or a plain listing for very large schemas
+        if len(rows) > VALIDATE_TABLE_LIMIT:
+            console.print("\n[bold]Fields:[/bold]")
+            console.out(
+                "\n".join(
+                    f"  {name}: {field_type}{' (required)' if is_required else ''}"
+                    for name, field_type, is_required, _ in rows
+                ),
+                highlight=False,
+            )
+        elif rows:
             console.print("\n[bold]Fields:[/bold]")
             table = Table(show_header=True, header_style="bold magenta")
             table.add_column("Field", style="cyan", no_wrap=True)
@@ -217,14 +264,8 @@ def validate(
             table.add_column("Required", justify="center")
             table.add_column("Description")
             
-            for name, prop in properties.items():
-                field_type = prop.get("type", "unknown")
-                is_required = "✓" if name in required else ""
-                description = prop.get("description", "")[:50]
-                if len(prop.get("description", "")) > 50:
-                    description += "..."
-                
-                table.add_row(name, field_type, is_required, description)
+            for row in rows:
+                table.add_row(*row)
             
             console.print(table)
         
@@ -261,12 +302,12 @@ def test(
         text2json test 1        # Test case 1 only
         text2json test --samples /path/to/samples
     """
-    console.print(
-        Panel.fit(
-            "[bold blue]Test Runner[/bold blue]",
-            border_style="blue",
-        )
-    )
+    from rich.table import Table
+    from converter import UniversalTextToJSONConverter
+    
+    console = get_console()
+    
+    console.print(get_header("Test Runner"))
     
     # Define test cases
     test_cases = {
@@ -330,7 +371,7 @@ def test(
         
         try:
             # Read input
-            text = input_path.read_text(encoding="utf-8")
+            text = input_path.read_bytes().decode("utf-8")
             console.print(f"Input size: {len(text):,} characters")
             
             # Convert
@@ -338,8 +379,7 @@ def test(
             
             # Save output
             output_path = samples_dir / f"test_case_{test_num}_output.json"
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(result, f, indent=2, ensure_ascii=False)
+            output_path.write_bytes(dump_json(result))
             
             console.print(f"[green]✓[/green] Success! Output saved to {output_path}")
             results.append((f"Test {test_num}", "Passed", str(output_path)))
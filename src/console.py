@@ -0,0 +1,15 @@
+"""
+Shared rich Console
+
+One Console for the whole process, created on first use so modules that
+only need it for occasional messages do not pay rich's import time.
+"""
+
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def get_console():
+    """Return the shared rich Console, created on first use."""
+    from rich.console import Console
+    return Console()
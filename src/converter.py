@@ -6,17 +6,510 @@ to JSON following any schema, using Instructor and OpenAI GPT models.
 """
 
 import instructor
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI, RateLimitError
 from pydantic import BaseModel, create_model, Field, ValidationError
-from typing import Dict, Any, Type, Union, Optional, List, Literal
+from typing import Dict, Any, Type, Union, Optional, List, Literal, Tuple, get_args, get_origin
+import asyncio
 import json
+import functools
 import hashlib
+import importlib.util
 import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-console = Console()
+try:  # imported as part of the src package
+    from .console import get_console
+except ImportError:  # src/ is on sys.path (CLI and scripts)
+    from console import get_console
+
+# orjson and xxhash are optional speedups for JSON handling and schema cache keys
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# tiktoken gives exact request token counts for rate limiting; without it
+# tokens are estimated at ~4 characters each
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+# Number of distinct schemas whose Pydantic models are kept per converter
+MODEL_CACHE_SIZE = 16
+
+# Generated model sources are persisted here so later runs skip model building.
+# Bump MODEL_CACHE_VERSION whenever schema-to-model conversion changes.
+MODEL_CACHE_DIR = Path.home() / ".cache" / "text2json" / "models"
+MODEL_CACHE_VERSION = 3
+
+# Characters not allowed in Python identifiers
+_IDENT_RE = re.compile(r'[^a-zA-Z0-9_]')
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    """Insert into a per-converter cache, evicting the oldest entry past MODEL_CACHE_SIZE."""
+    cache[key] = value
+    if len(cache) > MODEL_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _json_dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """Serialize obj to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:  # e.g. integers orjson cannot represent
+            pass
+    return json.dumps(obj, sort_keys=sort_keys).encode()
+
+
+def _json_loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON, using orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # NaN, huge integers etc., which the stdlib parser accepts
+    return json.loads(data)
+
+
+def _schema_digest(schema: Dict[str, Any]) -> bytes:
+    """Hash a schema's canonical (sorted-key) JSON form into an 8-byte digest."""
+    buf = _json_dumps(schema, sort_keys=True)
+    if xxhash is not None:
+        return xxhash.xxh3_64_digest(buf)
+    return hashlib.blake2b(buf, digest_size=8).digest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Any:
+    """tiktoken encoding for a model, or None if tiktoken cannot provide one."""
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:  # model unknown to this tiktoken version
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # e.g. the encoding file cannot be downloaded (offline, restrictive
+        # proxy); rate limiting then falls back to the character estimate
+        return None
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count (or, without tiktoken, estimate) the tokens in text for a model."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _is_rate_limit(error: Exception) -> bool:
+    """Whether an API call failed with a 429, possibly wrapped by instructor."""
+    return isinstance(error, RateLimitError) or isinstance(error.__cause__, RateLimitError)
+
+
+class TokenBucket:
+    """
+    Client-side requests-per-minute and tokens-per-minute limiter.
+    
+    Both budgets refill continuously over a minute. Callers reserve capacity
+    up front and wait out any shortfall, so concurrent callers queue up in
+    order instead of all hitting 429s at once. Thread safe.
+    
+    A limit of 0 or less disables that budget, so RPM=0 or TPM=0 means
+    "no limit".
+    """
+    
+    def __init__(self, rpm: int, tpm: int):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests = float(rpm)
+        self._tokens = float(tpm)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, tokens: int) -> float:
+        """
+        Take capacity for one request of the given size.
+        
+        Args:
+            tokens: Estimated tokens the request will use
+            
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            
+            # Balances may go negative; the debt is the caller's wait
+            wait = 0.0
+            if self.rpm > 0:
+                self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60) - 1
+                wait = max(wait, -self._requests * 60 / self.rpm)
+            if self.tpm > 0:
+                # A request larger than the whole budget waits for a full bucket
+                tokens = min(tokens, self.tpm)
+                self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60) - tokens
+                wait = max(wait, -self._tokens * 60 / self.tpm)
+            return wait
+    
+    def acquire(self, tokens: int) -> None:
+        """Block until a request of the given size fits within the limits."""
+        wait = self.reserve(tokens)
+        if wait:
+            time.sleep(wait)
+    
+    async def aacquire(self, tokens: int) -> None:
+        """Async version of acquire()."""
+        wait = self.reserve(tokens)
+        if wait:
+            await asyncio.sleep(wait)
+
+
+@functools.lru_cache(maxsize=None)
+def _sanitize_model_name(name: str) -> str:
+    """Turn a schema title or field path into a valid model class name."""
+    name = _IDENT_RE.sub('_', name)
+    if name[:1].isdigit():
+        name = f"Model_{name}"
+    return name
+
+
+@functools.lru_cache(maxsize=None)
+def _sanitize_field_name(name: str) -> str:
+    """Turn a property name (e.g. with hyphens, or $schema) into a valid field name."""
+    name = _IDENT_RE.sub('_', name)
+    if name[:1].isdigit():
+        name = f"field_{name}"
+    # Pydantic treats leading underscores as private attributes
+    if name.startswith('_'):
+        name = f"field{name}"
+    return name
+
+
+def _model_source(model: Type[BaseModel]) -> str:
+    """
+    Render a generated model (and its nested models) as importable Python source.
+    
+    Models are emitted as create_model() calls with field dicts, so field names
+    that are Python keywords or shadow typing helpers remain valid.
+    
+    Args:
+        model: Pydantic model built by _create_model_from_schema
+        
+    Returns:
+        Module source defining the model as MODEL
+        
+    Raises:
+        TypeError: If the model uses an annotation the renderer does not know
+    """
+    names: Dict[Type[BaseModel], str] = {}
+    blocks: List[str] = []
+    
+    def type_source(tp: Any) -> str:
+        if tp in (str, int, float, bool):
+            return tp.__name__
+        if tp is type(None):
+            return "None"
+        if isinstance(tp, type) and issubclass(tp, BaseModel):
+            return model_source(tp)
+        origin = get_origin(tp)
+        args = get_args(tp)
+        if origin is list:
+            return f"_List[{type_source(args[0])}]"
+        if origin is Union:
+            return f"_Union[{', '.join(type_source(a) for a in args)}]"
+        if origin is Literal:
+            return f"_Literal[{', '.join(repr(a) for a in args)}]"
+        raise TypeError(f"Cannot render annotation {tp!r}")
+    
+    def model_source(m: Type[BaseModel]) -> str:
+        if m in names:
+            return names[m]
+        fields = []
+        for field_name, info in m.model_fields.items():
+            default = "..." if info.is_required() else "None"
+            alias = f", alias={info.alias!r}" if info.alias else ""
+            fields.append(
+                f"    {field_name!r}: ({type_source(info.annotation)}, "
+                f"_Field({default}, description={info.description!r}{alias})),"
+            )
+        names[m] = f"_M{len(names)}"
+        blocks.append(f"{names[m]} = _create_model({m.__name__!r}, **{{\n" + "\n".join(fields) + "\n})")
+        return names[m]
+    
+    root = model_source(model)
+    return (
+        "from typing import List as _List, Literal as _Literal, Union as _Union\n"
+        "from pydantic import Field as _Field, create_model as _create_model\n\n"
+        + "\n\n".join(blocks)
+        + f"\n\nMODEL = {root}\n"
+    )
+
+
+def _load_model_source(path: Path) -> Type[BaseModel]:
+    """Import a module written by _model_source and return its MODEL."""
+    spec = importlib.util.spec_from_file_location(f"text2json_model_{path.stem}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.MODEL
+
+
+# Schema-to-model conversion runs in two passes: _compile() turns JSON schema
+# properties into a tree of small hashable nodes, then _materialize() maps the
+# nodes onto Python types. Materialized types are cached per node, so identical
+# (sub)schemas reuse the same Pydantic models instead of rebuilding them.
+
+@dataclass(frozen=True)
+class ScalarNode:
+    """A property that maps directly onto a Python type (str, int, ...)."""
+    type_: type
+
+
+@dataclass(frozen=True)
+class EnumNode:
+    """A string property restricted to a set of values."""
+    values: Tuple[Any, ...]
+    # Types of the values, so e.g. [0, 1] and [False, True] stay distinct
+    kinds: Tuple[type, ...]
+
+
+@dataclass(frozen=True)
+class ArrayNode:
+    """An array property."""
+    item: Any
+
+
+@dataclass(frozen=True)
+class UnionNode:
+    """A oneOf/anyOf property."""
+    options: Tuple[Any, ...]
+
+
+@dataclass(frozen=True)
+class FieldNode:
+    """One property of an object."""
+    name: str
+    node: Any
+    description: str
+    required: bool
+
+
+@dataclass(frozen=True)
+class ObjectNode:
+    """An object property (or the root schema), materialized as a Pydantic model."""
+    name: str
+    fields: Tuple[FieldNode, ...]
+
+
+_SCALAR_NODES = {
+    "string": ScalarNode(str),
+    "integer": ScalarNode(int),
+    "number": ScalarNode(float),
+    "boolean": ScalarNode(bool),
+    "null": ScalarNode(type(None)),
+}
+
+
+def _compile(prop: Dict[str, Any], field_name: str, memo: Optional[Dict[bytes, ObjectNode]] = None) -> Any:
+    """
+    Compile a JSON schema property into a node tree.
+    
+    Args:
+        prop: Property definition from JSON schema
+        field_name: Name of the field (for nested models)
+        memo: Object nodes already compiled during this conversion, keyed by
+            property digest, so repeated sub-objects become one node
+            
+    Returns:
+        Node describing the property's type
+    """
+    prop_type = prop.get("type", "string")
+    
+    # Handle basic types
+    if prop_type == "string" and prop.get("enum"):
+        values = tuple(prop["enum"])
+        return EnumNode(values, tuple(map(type, values)))
+    # Type arrays (e.g. ["string", "null"]) are unhashable; like any other
+    # unknown type they fall through to the string default below
+    if isinstance(prop_type, str) and prop_type in _SCALAR_NODES:
+        return _SCALAR_NODES[prop_type]
+    
+    # Handle arrays
+    if prop_type == "array":
+        return ArrayNode(_compile(prop.get("items", {}), f"{field_name}Item", memo))
+    
+    # Handle objects (nested models)
+    if prop_type == "object":
+        # Identical sub-objects (e.g. an address under home and work) share
+        # one model, named after the first field they appear under
+        if memo is not None:
+            key = _schema_digest(prop)
+            if key in memo:
+                return memo[key]
+        
+        node = _compile_object(
+            f"{field_name}Model",
+            prop.get("properties", {}),
+            prop.get("required", []),
+            prefix=field_name,
+            memo=memo,
+        )
+        if memo is not None:
+            memo[key] = node
+        return node
+    
+    # Handle union types (oneOf, anyOf)
+    if "oneOf" in prop or "anyOf" in prop:
+        options = prop.get("oneOf", prop.get("anyOf", []))
+        return UnionNode(tuple(
+            _compile(opt, f"{field_name}Option{i}", memo) for i, opt in enumerate(options)
+        ))
+    
+    # Default to string for unknown types
+    return _SCALAR_NODES["string"]
+
+
+def _compile_object(model_name: str,
+                    properties: Dict[str, Any],
+                    required: List[str],
+                    prefix: Optional[str] = None,
+                    memo: Optional[Dict[bytes, ObjectNode]] = None) -> ObjectNode:
+    """
+    Compile an object's properties into an ObjectNode.
+    
+    Args:
+        model_name: Name for the model (sanitized to a valid identifier)
+        properties: Property definitions from JSON schema
+        required: Names of required properties
+        prefix: Name prefix for nested models (None for the root model)
+        memo: Object nodes already compiled during this conversion
+        
+    Returns:
+        ObjectNode for the model
+    """
+    required = set(required)
+    return ObjectNode(_sanitize_model_name(model_name), tuple(
+        FieldNode(
+            name,
+            _compile(prop, name if prefix is None else f"{prefix}_{name}", memo),
+            prop.get("description", ""),
+            name in required,
+        )
+        for name, prop in properties.items()
+    ))
+
+
+def _materialize(node: Any) -> Any:
+    """Python type for a compiled node, reusing the type built for an equal node."""
+    try:
+        hash(node)
+    except TypeError:  # enum with unhashable values (e.g. lists), build uncached
+        return _build_type(node)
+    return _materialize_cached(node)
+
+
+@functools.lru_cache(maxsize=256)
+def _materialize_cached(node: Any) -> Any:
+    """Cached _build_type() for hashable nodes."""
+    return _build_type(node)
+
+
+def _build_type(node: Any) -> Any:
+    """Map one compiled node onto a Python type, materializing its children."""
+    if isinstance(node, ScalarNode):
+        return node.type_
+    if isinstance(node, EnumNode):
+        # For enums, use a single Literal of the values instead of an Enum
+        # class. This avoids issues with special characters in enum names
+        # and validates with one lookup instead of trying each option.
+        return Literal[node.values]
+    if isinstance(node, ArrayNode):
+        return List[_materialize(node.item)]
+    if isinstance(node, UnionNode):
+        return Union[tuple(_materialize(opt) for opt in node.options)]
+    
+    fields = {}
+    for f in node.fields:
+        field_type = _materialize(f.node)
+        default = ... if f.required else None
+        
+        # Use alias if the name had to be changed into a valid identifier
+        field_name = _sanitize_field_name(f.name)
+        if field_name != f.name:
+            fields[field_name] = (field_type, Field(default, description=f.description, alias=f.name))
+        else:
+            fields[f.name] = (field_type, Field(default, description=f.description))
+    
+    return create_model(node.name, **fields)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_response_model(model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Wrap a model the way Instructor does for each request, once per model.
+    
+    Instructor subclasses plain models on every create() call, which also
+    defeats its cache of the derived tool schema. Passing the wrapped class
+    skips both, so the tool schema is built once per model.
+    
+    Args:
+        model: Pydantic model the response must validate against
+        
+    Returns:
+        Model subclass carrying Instructor's response handling
+    """
+    return instructor.openai_schema(model)
+
+
+@functools.lru_cache(maxsize=64)
+def _tool_schema_tokens(model: Type[BaseModel]) -> int:
+    """Estimated tokens of the tool schema Instructor sends for a model."""
+    # For large schemas this is often most of a request's input tokens
+    return len(_json_dumps(_get_response_model(model).openai_schema)) // 4
+
+
+@functools.lru_cache(maxsize=64)
+def _get_batch_model(model: Type[BaseModel], size: int) -> Type[BaseModel]:
+    """
+    Wrap a model in a container that holds exactly `size` items.
+    
+    Cached at module level on the model alone, so converters are not kept
+    alive by the cache.
+    
+    Args:
+        model: Pydantic model for a single item
+        size: Number of texts in the batch
+        
+    Returns:
+        Pydantic model class with an `items` list field
+    """
+    return create_model(
+        f"Batch{size}{model.__name__}",
+        items=(
+            List[model],
+            Field(..., min_length=size, max_length=size,
+                  description=f"Exactly {size} extracted objects, one per input row, in row order"),
+        ),
+    )
 
 
 class UniversalTextToJSONConverter:
@@ -38,23 +531,49 @@ class UniversalTextToJSONConverter:
             raise ValueError("OpenAI API key required. Set OPENAI_API_KEY or pass api_key parameter.")
         
         self.model = model or os.getenv("DEFAULT_MODEL", "gpt-4.1")
+        self.openai = OpenAI(api_key=self.api_key)
         self.client = instructor.from_openai(
-            OpenAI(api_key=self.api_key),
+            self.openai,
             mode=instructor.Mode.TOOLS
         )
-        self.model_cache = {}
+        self.aclient = instructor.from_openai(
+            AsyncOpenAI(api_key=self.api_key),
+            mode=instructor.Mode.TOOLS
+        )
+        self.model_cache = OrderedDict()
+        self._loaded_schemas = OrderedDict()
+        self._schema_key_cache = OrderedDict()
+        self._schema_sizes = OrderedDict()
+        self._schema_summaries = OrderedDict()
+        
+        # The system message never changes, so every request shares one dict.
+        # Prompts also put the schema summary before the input text, so requests
+        # for the same schema share a prefix that OpenAI's prompt caching reuses.
+        self._system_msg = {"role": "system", "content": self.UNIVERSAL_SYSTEM_PROMPT}
         self.max_retries = int(os.getenv("MAX_RETRIES", "3"))
         self.temperature = float(os.getenv("TEMPERATURE", "0"))
+        self.batch_size = int(os.getenv("BATCH_SIZE", "10"))
+        
+        # Client-side rate limiting, matched to the account's OpenAI limits
+        self._bucket = TokenBucket(
+            rpm=int(os.getenv("RPM", "500")),
+            tpm=int(os.getenv("TPM", "200000"))
+        )
+        self._system_tokens = None  # counted on the first request
     
     def convert(self, 
                 text: str, 
-                schema: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+                schema: Union[str, Path, Dict[str, Any]],
+                quiet: Optional[bool] = None) -> Dict[str, Any]:
         """
         Convert unstructured text to JSON following the provided schema.
         
         Args:
             text: Any unstructured text (resume, bibtex, description, etc.)
             schema: JSON schema as file path, Path object, or dict
+            quiet: Skip the progress spinner (required when converting from
+                several threads, since rich allows one live display at a time).
+                Defaults to quiet unless stdout is a terminal.
             
         Returns:
             Dictionary following the provided schema
@@ -64,6 +583,17 @@ class UniversalTextToJSONConverter:
             FileNotFoundError: If schema file not found
             JSONDecodeError: If schema file is invalid JSON
         """
+        if quiet is None:
+            # Checked on sys.stdout directly so quiet runs never import rich
+            quiet = not (sys.stdout is not None and sys.stdout.isatty())
+        if quiet:
+            schema_dict = self._load_schema(schema)
+            model = self._get_pydantic_model(schema_dict)
+            return self._extract_with_retries(text, model, schema_dict).model_dump()
+        
+        from rich.progress import Progress, SpinnerColumn, TextColumn
+        
+        console = get_console()
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -93,8 +623,189 @@ class UniversalTextToJSONConverter:
                 console.print(f"[red]✗[/red] Extraction failed: {str(e)}")
                 raise
     
+    def convert_batch(self,
+                      texts: List[str],
+                      schema: Union[str, Path, Dict[str, Any]],
+                      batch_size: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Convert several texts with the same schema, packing them into shared requests.
+        
+        Each request carries up to batch_size texts, so the system prompt and
+        per-request latency are paid once per batch instead of once per text.
+        
+        Args:
+            texts: Unstructured texts to convert
+            schema: JSON schema as file path, Path object, or dict
+            batch_size: Texts per request (defaults to BATCH_SIZE env var or 10)
+            
+        Returns:
+            One dictionary per input text, in input order
+        """
+        batch_size = batch_size or self.batch_size
+        schema_dict = self._load_schema(schema)
+        model = self._get_pydantic_model(schema_dict)
+        
+        results = []
+        for start in range(0, len(texts), batch_size):
+            chunk = texts[start:start + batch_size]
+            if len(chunk) == 1:
+                results.append(self._extract_with_retries(chunk[0], model, schema_dict).model_dump())
+                continue
+            
+            batch_model = _get_batch_model(model, len(chunk))
+            prompt = self._create_batch_prompt(chunk, schema_dict)
+            response = self._complete(prompt, batch_model)
+            results.extend(item.model_dump() for item in response.items)
+        
+        return results
+    
+    async def aconvert(self,
+                       text: str,
+                       schema: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Async version of convert() using the AsyncOpenAI client (no progress spinner).
+        
+        Args:
+            text: Any unstructured text (resume, bibtex, description, etc.)
+            schema: JSON schema as file path, Path object, or dict
+            
+        Returns:
+            Dictionary following the provided schema
+        """
+        schema_dict = self._load_schema(schema)
+        model = self._get_pydantic_model(schema_dict)
+        result = await self._aextract_with_retries(text, model, schema_dict)
+        return result.model_dump()
+    
+    async def aconvert_many(self,
+                            texts: List[str],
+                            schema: Union[str, Path, Dict[str, Any]],
+                            concurrency: int = 20) -> List[Union[Dict[str, Any], BaseException]]:
+        """
+        Convert several texts concurrently, with at most `concurrency` requests in flight.
+        
+        Args:
+            texts: Unstructured texts to convert
+            schema: JSON schema as file path, Path object, or dict
+            concurrency: Maximum number of simultaneous API requests
+            
+        Returns:
+            One entry per input text, in input order: the extracted dictionary,
+            or the exception raised for that text
+        """
+        schema_dict = self._load_schema(schema)
+        model = self._get_pydantic_model(schema_dict)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def convert_one(text: str) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self._aextract_with_retries(text, model, schema_dict)
+            return result.model_dump()
+        
+        return await asyncio.gather(*(convert_one(text) for text in texts), return_exceptions=True)
+    
+    def convert_batch_api(self,
+                          texts: List[str],
+                          schema: Union[str, Path, Dict[str, Any]],
+                          poll_interval: float = 5.0,
+                          max_poll_interval: float = 300.0) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Convert many texts offline through the OpenAI Batch API.
+        
+        Batch requests cost about half as much as regular requests and are not
+        subject to the usual rate limits, but may take up to 24 hours. This
+        call blocks until the batch finishes. There is no gpt-4o fallback.
+        
+        Args:
+            texts: Unstructured texts to convert
+            schema: JSON schema as file path, Path object, or dict
+            poll_interval: Initial delay between status checks, in seconds
+            max_poll_interval: Upper bound for the exponential poll backoff
+            
+        Returns:
+            One entry per input text, in input order: the extracted dictionary,
+            or the exception describing why that request failed
+            
+        Raises:
+            RuntimeError: If the batch as a whole fails, expires or is cancelled
+        """
+        schema_dict = self._load_schema(schema)
+        model = self._get_pydantic_model(schema_dict)
+        
+        # Build one chat completion request per text, forcing the same
+        # (cached) schema tool Instructor sends for regular requests
+        function = _get_response_model(model).openai_schema
+        tool = {"type": "function", "function": function}
+        lines = []
+        for i, text in enumerate(texts):
+            body = {
+                "model": self.model,
+                "messages": self._build_messages(self._create_extraction_prompt(text, schema_dict)),
+                "tools": [tool],
+                "tool_choice": {"type": "function", "function": {"name": function["name"]}},
+                "temperature": self.temperature,
+            }
+            lines.append(_json_dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }))
+        
+        # Upload requests and start the batch
+        batch_file = self.openai.files.create(
+            file=("batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+        )
+        batch = self.openai.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        get_console().print(f"[dim]Submitted batch {batch.id} with {len(texts)} requests[/dim]")
+        
+        # Poll with exponential backoff until the batch reaches a final state
+        delay = poll_interval
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            time.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = self.openai.batches.retrieve(batch.id)
+        
+        if batch.status != "completed":
+            raise RuntimeError(f"Batch {batch.id} ended with status '{batch.status}'")
+        
+        # Parse results back through the Pydantic model, matched by custom_id
+        results: List[Union[Dict[str, Any], Exception]] = [
+            ValueError(f"No result returned for request {i}") for i in range(len(texts))
+        ]
+        if batch.output_file_id:
+            output = self.openai.files.content(batch.output_file_id).content
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = _json_loads(line)
+                i = int(record["custom_id"])
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    results[i] = ValueError(f"Request {i} failed: {record.get('error') or response.get('body')}")
+                    continue
+                try:
+                    message = response["body"]["choices"][0]["message"]
+                    arguments = message["tool_calls"][0]["function"]["arguments"]
+                    results[i] = model.model_validate_json(arguments).model_dump()
+                except (KeyError, IndexError, TypeError, ValidationError) as e:
+                    results[i] = ValueError(f"Request {i} returned an invalid result: {e}")
+        
+        return results
+    
     def _load_schema(self, schema: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
-        """Load schema from file path or use dict directly."""
+        """
+        Load schema from file path or use dict directly.
+        
+        Schema files are parsed once per (path, mtime, size), so an edited file
+        is picked up. The parsed dict never leaves the converter, so its cache
+        key is computed here once and reused by _get_schema_key().
+        """
         if isinstance(schema, dict):
             return schema
         
@@ -102,8 +813,14 @@ class UniversalTextToJSONConverter:
         if not schema_path.exists():
             raise FileNotFoundError(f"Schema file not found: {schema_path}")
         
-        with open(schema_path) as f:
-            return json.load(f)
+        stat = schema_path.stat()
+        file_key = (str(schema_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        schema_dict = self._loaded_schemas.get(file_key)
+        if schema_dict is None:
+            schema_dict = _json_loads(schema_path.read_bytes())
+            _cache_put(self._loaded_schemas, file_key, schema_dict)
+            _cache_put(self._schema_key_cache, id(schema_dict), (schema_dict, _schema_digest(schema_dict)))
+        return schema_dict
     
     def _get_pydantic_model(self, schema: Dict[str, Any]) -> Type[BaseModel]:
         """
@@ -115,155 +832,98 @@ class UniversalTextToJSONConverter:
         Returns:
             Pydantic model class
         """
-        # Create unique key for this schema
-        schema_str = json.dumps(schema, sort_keys=True)
-        schema_hash = hashlib.md5(schema_str.encode()).hexdigest()
+        schema_key = self._get_schema_key(schema)
         
-        # Return cached model if exists
-        if schema_hash in self.model_cache:
-            return self.model_cache[schema_hash]
+        # Return cached model if exists, marking it most recently used
+        if schema_key in self.model_cache:
+            self.model_cache.move_to_end(schema_key)
+            return self.model_cache[schema_key]
         
-        # Create new model
-        model = self._create_model_from_schema(schema)
-        self.model_cache[schema_hash] = model
+        # Reuse a model persisted by an earlier run, or create a new one from
+        # the original schema so field order is preserved
+        cache_path = MODEL_CACHE_DIR / f"v{MODEL_CACHE_VERSION}_{schema_key.hex()}.py"
+        model = None
+        if cache_path.exists():
+            try:
+                model = _load_model_source(cache_path)
+            except Exception:
+                model = None  # Corrupt or stale cache file, rebuild below
+        if model is None:
+            model = self._create_model_from_schema(schema)
+            self._persist_model(model, cache_path)
+        
+        _cache_put(self.model_cache, schema_key, model)
         return model
     
-    def _create_model_from_schema(self, schema: Dict[str, Any]) -> Type[BaseModel]:
+    def _persist_model(self, model: Type[BaseModel], cache_path: Path) -> None:
+        """Write a model's source to the disk cache; failures are ignored."""
+        try:
+            source = _model_source(model)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(source, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except (OSError, TypeError):
+            pass  # Caching is best effort, the in-memory model is still used
+    
+    def _get_schema_key(self, schema: Dict[str, Any]) -> bytes:
         """
-        Convert JSON schema to Pydantic model dynamically.
-        Handles nested objects, arrays, references, and complex types.
+        Return the cache key for a schema, skipping the hash for loaded schema files.
+        
+        Dicts passed in by callers are hashed on every call, so mutating one
+        and converting again rebuilds the model as expected.
         
         Args:
             schema: JSON schema dictionary
             
         Returns:
-            Pydantic model class
+            8-byte digest of the canonical schema
         """
-        # Get schema properties
-        properties = schema.get("properties", {})
-        required = schema.get("required", [])
-        title = schema.get("title", "DynamicModel")
+        # Fast path: a dict this converter parsed from a schema file (see
+        # _load_schema), which callers never see and so cannot mutate. The
+        # entry keeps the dict alive so its id cannot be reused meanwhile.
+        entry = self._schema_key_cache.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            return entry[1]
         
-        # Sanitize title to ensure valid Python identifier
-        import re
-        title = re.sub(r'[^a-zA-Z0-9_]', '_', title)
-        if title[0].isdigit():
-            title = f"Model_{title}"
+        return _schema_digest(schema)
+    
+    def _get_schema_size(self, schema: Dict[str, Any]) -> int:
+        """
+        Return the serialized length of a schema, computed once per distinct schema.
         
-        # Build field definitions
-        fields = {}
-        for name, prop in properties.items():
-            field_type = self._get_field_type(prop, name)
-            is_required = name in required
-            description = prop.get("description", "")
-            
-            # Handle field names with hyphens or other invalid Python identifiers
-            field_name = re.sub(r'[^a-zA-Z0-9_]', '_', name)
-            if field_name[0].isdigit():
-                field_name = f"field_{field_name}"
-            # Handle fields starting with underscore (e.g., from $schema)
-            if field_name.startswith('_'):
-                field_name = f"field{field_name}"
+        Args:
+            schema: JSON schema dictionary
             
-            # Use alias if field name was modified
-            if field_name != name:
-                if is_required:
-                    fields[field_name] = (field_type, Field(..., description=description, alias=name))
-                else:
-                    fields[field_name] = (field_type, Field(None, description=description, alias=name))
-            else:
-                if is_required:
-                    fields[name] = (field_type, Field(..., description=description))
-                else:
-                    fields[name] = (field_type, Field(None, description=description))
-        
-        # Create and return model
-        return create_model(title, **fields)
+        Returns:
+            Length of json.dumps(schema)
+        """
+        # Stays on the stdlib encoder: the prompt thresholds are defined in
+        # terms of its (spaced, ASCII-escaped) output, and this runs once per schema
+        schema_key = self._get_schema_key(schema)
+        size = self._schema_sizes.get(schema_key)
+        if size is None:
+            size = len(json.dumps(schema))
+            _cache_put(self._schema_sizes, schema_key, size)
+        return size
     
-    def _get_field_type(self, prop: Dict[str, Any], field_name: str) -> Any:
+    def _create_model_from_schema(self, schema: Dict[str, Any]) -> Type[BaseModel]:
         """
-        Convert JSON schema property to Python type.
+        Convert JSON schema to Pydantic model dynamically.
+        Handles nested objects, arrays, references, and complex types.
         
         Args:
-            prop: Property definition from JSON schema
-            field_name: Name of the field (for nested models)
+            schema: JSON schema dictionary
             
         Returns:
-            Python type for Pydantic field
-        """
-        prop_type = prop.get("type", "string")
-        
-        # Handle basic types
-        if prop_type == "string":
-            if "enum" in prop:
-                # For enums, just use Union of Literal values instead of Enum class
-                # This avoids issues with special characters in enum names
-                from typing import Literal
-                return Union[tuple(Literal[v] for v in prop["enum"])]
-            return str
-        elif prop_type == "integer":
-            return int
-        elif prop_type == "number":
-            return float
-        elif prop_type == "boolean":
-            return bool
-        elif prop_type == "null":
-            return type(None)
-        
-        # Handle arrays
-        elif prop_type == "array":
-            items = prop.get("items", {})
-            item_type = self._get_field_type(items, f"{field_name}Item")
-            return List[item_type]
-        
-        # Handle objects (nested models)
-        elif prop_type == "object":
-            nested_properties = prop.get("properties", {})
-            nested_required = prop.get("required", [])
-            
-            # Create nested model
-            nested_fields = {}
-            for nested_name, nested_prop in nested_properties.items():
-                nested_type = self._get_field_type(nested_prop, f"{field_name}_{nested_name}")
-                is_required = nested_name in nested_required
-                description = nested_prop.get("description", "")
-                
-                # Handle field names with hyphens or other invalid Python identifiers
-                import re
-                nested_field_name = re.sub(r'[^a-zA-Z0-9_]', '_', nested_name)
-                if nested_field_name[0].isdigit():
-                    nested_field_name = f"field_{nested_field_name}"
-                # Handle fields starting with underscore (e.g., from $schema)
-                if nested_field_name.startswith('_'):
-                    nested_field_name = f"field{nested_field_name}"
-                
-                # Use alias if field name was modified
-                if nested_field_name != nested_name:
-                    if is_required:
-                        nested_fields[nested_field_name] = (nested_type, Field(..., description=description, alias=nested_name))
-                    else:
-                        nested_fields[nested_field_name] = (nested_type, Field(None, description=description, alias=nested_name))
-                else:
-                    if is_required:
-                        nested_fields[nested_name] = (nested_type, Field(..., description=description))
-                    else:
-                        nested_fields[nested_name] = (nested_type, Field(None, description=description))
-            
-            # Sanitize model name
-            import re
-            model_name = re.sub(r'[^a-zA-Z0-9_]', '_', f"{field_name}Model")
-            if model_name[0].isdigit():
-                model_name = f"Model_{model_name}"
-            return create_model(model_name, **nested_fields)
-        
-        # Handle union types (oneOf, anyOf)
-        elif "oneOf" in prop or "anyOf" in prop:
-            options = prop.get("oneOf", prop.get("anyOf", []))
-            types = [self._get_field_type(opt, f"{field_name}Option{i}") for i, opt in enumerate(options)]
-            return Union[tuple(types)]
-        
-        # Default to string for unknown types
-        return str
+            Pydantic model class
+        """
+        return _materialize(_compile_object(
+            schema.get("title", "DynamicModel"),
+            schema.get("properties", {}),
+            schema.get("required", []),
+            memo={},
+        ))
     
     def _extract_with_retries(self, 
                             text: str, 
@@ -282,51 +942,138 @@ class UniversalTextToJSONConverter:
         """
         # Create optimized prompt
         prompt = self._create_extraction_prompt(text, schema)
+        return self._complete(prompt, model)
+    
+    def _complete(self, prompt: str, response_model: Type[BaseModel]) -> BaseModel:
+        """
+        Run one extraction request, falling back to gpt-4o if GPT-4.1 fails.
+        
+        Rate-limited requests are retried on the same model rather than
+        triggering the fallback.
         
+        Args:
+            prompt: User prompt containing the text(s) to extract from
+            response_model: Pydantic model the response must validate against
+            
+        Returns:
+            Validated Pydantic model instance
+        """
         # Determine which model to use
         use_model = self.model
         
         # Try primary model (GPT-4.1 if requested)
         if self.model == "gpt-4.1":
+            try:
+                return self._create("gpt-4.1", prompt, response_model)
+            except Exception as e:
+                if _is_rate_limit(e):
+                    raise
+                # Fallback to gpt-4o
+                get_console().print(f"[yellow]Note: GPT-4.1 not available, using gpt-4o[/yellow]")
+                use_model = "gpt-4o"
+        
+        # Use the selected model
+        return self._create(use_model, prompt, response_model)
+    
+    def _create(self, model: str, prompt: str, response_model: Type[BaseModel]) -> BaseModel:
+        """
+        Send one request within the rate limits, backing off on 429s.
+        
+        Args:
+            model: OpenAI model name
+            prompt: User prompt containing the text(s) to extract from
+            response_model: Pydantic model the response must validate against
+            
+        Returns:
+            Validated Pydantic model instance
+        """
+        tokens = self._estimate_tokens(prompt, model, response_model)
+        for attempt in range(self.max_retries + 1):
+            self._bucket.acquire(tokens)
             try:
                 return self.client.chat.completions.create(
-                    model="gpt-4.1",
-                    response_model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": self.UNIVERSAL_SYSTEM_PROMPT
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
+                    model=model,
+                    response_model=_get_response_model(response_model),
+                    messages=self._build_messages(prompt),
                     max_retries=self.max_retries,
                     temperature=self.temperature
                 )
             except Exception as e:
+                if not _is_rate_limit(e) or attempt == self.max_retries:
+                    raise
+                time.sleep(self._backoff(attempt))
+    
+    async def _aextract_with_retries(self,
+                                     text: str,
+                                     model: Type[BaseModel],
+                                     schema: Dict[str, Any]) -> BaseModel:
+        """Async version of _extract_with_retries()."""
+        prompt = self._create_extraction_prompt(text, schema)
+        return await self._acomplete(prompt, model)
+    
+    async def _acomplete(self, prompt: str, response_model: Type[BaseModel]) -> BaseModel:
+        """Async version of _complete(), with the same gpt-4o fallback."""
+        # Determine which model to use
+        use_model = self.model
+        
+        # Try primary model (GPT-4.1 if requested)
+        if self.model == "gpt-4.1":
+            try:
+                return await self._acreate("gpt-4.1", prompt, response_model)
+            except Exception as e:
+                if _is_rate_limit(e):
+                    raise
                 # Fallback to gpt-4o
-                console.print(f"[yellow]Note: GPT-4.1 not available, using gpt-4o[/yellow]")
+                get_console().print("[yellow]Note: GPT-4.1 not available, using gpt-4o[/yellow]")
                 use_model = "gpt-4o"
         
-        # Use the selected model
-        return self.client.chat.completions.create(
-            model=use_model,
-            response_model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": self.UNIVERSAL_SYSTEM_PROMPT
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            max_retries=self.max_retries,
-            temperature=self.temperature
-        )
+        return await self._acreate(use_model, prompt, response_model)
+    
+    async def _acreate(self, model: str, prompt: str, response_model: Type[BaseModel]) -> BaseModel:
+        """Async version of _create()."""
+        messages = self._build_messages(prompt)
+        tokens = self._estimate_tokens(prompt, model, response_model)
+        for attempt in range(self.max_retries + 1):
+            await self._bucket.aacquire(tokens)
+            try:
+                return await self.aclient.chat.completions.create(
+                    model=model,
+                    response_model=_get_response_model(response_model),
+                    messages=messages,
+                    max_retries=self.max_retries,
+                    temperature=self.temperature
+                )
+            except Exception as e:
+                if not _is_rate_limit(e) or attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+    
+    def _estimate_tokens(self, prompt: str, model: str, response_model: Type[BaseModel]) -> int:
+        """
+        Estimate the input tokens of one request for the rate limiter.
+        
+        Args:
+            prompt: User prompt containing the text(s) to extract from
+            model: OpenAI model name
+            response_model: Pydantic model whose tool schema is sent along
+            
+        Returns:
+            Tokens for the system message, the prompt and the tool schema
+        """
+        # Counted here rather than in __init__, so building a converter never
+        # loads (or downloads) a tiktoken encoding
+        if self._system_tokens is None:
+            self._system_tokens = _count_tokens(self.UNIVERSAL_SYSTEM_PROMPT, model)
+        return self._system_tokens + _count_tokens(prompt, model) + _tool_schema_tokens(response_model)
+    
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Jittered exponential delay before retrying a rate-limited request."""
+        return min(2 ** attempt, 60) * random.uniform(0.5, 1.5)
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Chat messages for a request: the shared system message, then the prompt."""
+        return [self._system_msg, {"role": "user", "content": prompt}]
     
     def _create_extraction_prompt(self, text: str, schema: Dict[str, Any]) -> str:
         """
@@ -340,8 +1087,8 @@ class UniversalTextToJSONConverter:
             Formatted prompt string
         """
         # For large schemas, include a summary
-        if len(json.dumps(schema)) > 10000:
-            schema_summary = self._summarize_schema(schema)
+        if self._get_schema_size(schema) > 10000:
+            schema_summary = self._get_schema_summary(schema)
             return f"""Extract structured information from the following text.
 
 SCHEMA SUMMARY:
@@ -359,6 +1106,42 @@ TEXT TO EXTRACT FROM:
 
 Extract all relevant information and ensure it matches the schema exactly."""
     
+    def _create_batch_prompt(self, texts: List[str], schema: Dict[str, Any]) -> str:
+        """
+        Create a prompt that asks for one extraction per input row.
+        
+        Args:
+            texts: Input texts, one per row
+            schema: JSON schema for context
+            
+        Returns:
+            Formatted prompt string
+        """
+        rows = "\n\n".join(f"--- ROW {i} ---\n{text}" for i, text in enumerate(texts, 1))
+        
+        # For large schemas, include a summary. It comes before anything that
+        # depends on the batch so the prompt prefix stays cacheable.
+        schema_section = ""
+        if self._get_schema_size(schema) > 10000:
+            schema_section = f"\nSCHEMA SUMMARY:\n{self._get_schema_summary(schema)}\n"
+        
+        return f"""Extract structured information from each of the rows below according to the schema.
+{schema_section}
+Each row is a separate, independent document. Return exactly {len(texts)} items, one per row, in the same order as the rows.
+
+{rows}
+
+Extract all relevant information for every row and ensure each item matches the schema exactly."""
+    
+    def _get_schema_summary(self, schema: Dict[str, Any]) -> str:
+        """Return _summarize_schema(schema), built once per distinct schema."""
+        schema_key = self._get_schema_key(schema)
+        summary = self._schema_summaries.get(schema_key)
+        if summary is None:
+            summary = self._summarize_schema(schema)
+            _cache_put(self._schema_summaries, schema_key, summary)
+        return summary
+    
     def _summarize_schema(self, schema: Dict[str, Any]) -> str:
         """
         Create a concise summary of large schemas.
@@ -5,26 +5,48 @@ Handles extraction of text from PDF files for the Text-to-JSON converter.
 Supports multiple extraction methods for different PDF types.
 """
 
-import fitz  # PyMuPDF
-import pdfplumber
+import hashlib
+import io
+import os
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Optional
-from rich.console import Console
+from typing import Callable, Iterator, List, Optional
 
-console = Console()
+try:  # imported as part of the src package
+    from .console import get_console
+except ImportError:  # src/ is on sys.path (CLI and scripts)
+    from console import get_console
+
+# fitz (PyMuPDF) and pdfplumber are imported on first use: they are slow to
+# import and not needed by callers that only preprocess text
+
+# Common bullet point characters, replaced by a uniform "• " bullet
+_BULLET_CHARS = ('•', '●', '○', '■', '□', '▪', '▫', '-', '*')
+
+# Headings that start a references section, checked in this order
+_REF_MARKERS = ('References', 'REFERENCES', 'Bibliography', 'BIBLIOGRAPHY')
+
+# Extracted PDF text is cached here so repeated runs skip the PDF parser.
+# Bump PDF_CACHE_VERSION whenever extraction or preprocessing output changes.
+PDF_CACHE_DIR = Path.home() / ".cache" / "text2json"
+PDF_CACHE_VERSION = 1
 
 
 class PDFHandler:
     """Handle PDF text extraction with multiple fallback methods."""
     
     @staticmethod
-    def extract_text(pdf_path: Path, method: str = "auto") -> str:
+    def extract_text(pdf_path: Path, method: str = "auto", workers: int = 1) -> str:
         """
         Extract text from PDF file.
         
         Args:
             pdf_path: Path to PDF file
             method: Extraction method ("pymupdf", "pdfplumber", "auto")
+            workers: Number of processes to spread pages across (1 = in-process)
             
         Returns:
             Extracted text as string
@@ -34,56 +56,133 @@ class PDFHandler:
         """
         if method == "auto":
             # Try PyMuPDF first (usually better for academic papers)
+            pymupdf_text = ""
             try:
-                text = PDFHandler._extract_with_pymupdf(pdf_path)
-                if text and len(text.strip()) > 100:  # Ensure meaningful content
-                    console.print("[green]✓[/green] Extracted text using PyMuPDF")
-                    return text
+                pymupdf_text = PDFHandler._extract_with_pymupdf(pdf_path, workers)
+                if len(pymupdf_text.strip()) > 100:  # Ensure meaningful content
+                    get_console().print("[green]✓[/green] Extracted text using PyMuPDF")
+                    return pymupdf_text
             except Exception as e:
-                console.print(f"[yellow]PyMuPDF failed: {e}, trying pdfplumber...[/yellow]")
+                get_console().print(f"[yellow]PyMuPDF failed: {e}, trying pdfplumber...[/yellow]")
             
             # Fallback to pdfplumber (better for tables/structured content)
             try:
-                text = PDFHandler._extract_with_pdfplumber(pdf_path)
-                if text and len(text.strip()) > 100:
-                    console.print("[green]✓[/green] Extracted text using pdfplumber")
+                text = PDFHandler._extract_with_pdfplumber(pdf_path, workers)
+                if len(text.strip()) > 100:
+                    get_console().print("[green]✓[/green] Extracted text using pdfplumber")
                     return text
             except Exception as e:
-                console.print(f"[red]pdfplumber also failed: {e}[/red]")
-                raise ValueError(f"Could not extract text from PDF: {pdf_path}")
+                get_console().print(f"[red]pdfplumber also failed: {e}[/red]")
+                text = ""
+            
+            # Neither found much text, keep whatever PyMuPDF already extracted
+            # rather than discarding it
+            best = max(pymupdf_text, text, key=lambda t: len(t.strip()))
+            if best.strip():
+                return best
+            raise ValueError(f"Could not extract text from PDF: {pdf_path}")
         
         elif method == "pymupdf":
-            return PDFHandler._extract_with_pymupdf(pdf_path)
+            return PDFHandler._extract_with_pymupdf(pdf_path, workers)
         elif method == "pdfplumber":
-            return PDFHandler._extract_with_pdfplumber(pdf_path)
+            return PDFHandler._extract_with_pdfplumber(pdf_path, workers)
         else:
             raise ValueError(f"Unknown extraction method: {method}")
     
     @staticmethod
-    def _extract_with_pymupdf(pdf_path: Path) -> str:
+    def _join_chunks(chunks: Iterator[str]) -> str:
+        """Join text chunks with blank lines, streaming them into one buffer."""
+        buf = io.StringIO()
+        for i, chunk in enumerate(chunks):
+            if i:
+                buf.write("\n\n")
+            buf.write(chunk)
+        return buf.getvalue()
+    
+    @staticmethod
+    def _iter_parallel(page_range_fn: Callable[[Path, int, int], List[str]],
+                       pdf_path: Path,
+                       page_count: int,
+                       workers: int) -> Iterator[str]:
+        """
+        Run page_range_fn over contiguous page ranges in worker processes.
+        
+        Each worker opens the PDF once for its range; chunks are yielded in
+        page order.
+        """
+        if page_count == 0:
+            return
+        workers = min(workers, page_count)
+        bounds = [page_count * i // workers for i in range(workers + 1)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunks in executor.map(page_range_fn, repeat(pdf_path), bounds[:-1], bounds[1:]):
+                yield from chunks
+    
+    @staticmethod
+    def _extract_with_pymupdf(pdf_path: Path, workers: int = 1) -> str:
         """Extract text using PyMuPDF (fitz)."""
-        text_parts = []
+        if workers > 1:
+            import fitz  # PyMuPDF
+            
+            # PyMuPDF is not thread safe, so pages are split across processes
+            with fitz.open(str(pdf_path)) as doc:
+                page_count = len(doc)
+            chunks = PDFHandler._iter_parallel(
+                PDFHandler._pymupdf_page_range, pdf_path, page_count, workers
+            )
+        else:
+            chunks = PDFHandler._iter_pymupdf(pdf_path)
+        return PDFHandler._join_chunks(chunks)
+    
+    @staticmethod
+    def _pymupdf_page_range(pdf_path: Path, start: int, stop: int) -> List[str]:
+        """Extract pages [start, stop) with PyMuPDF (runs in a worker process)."""
+        return list(PDFHandler._iter_pymupdf(pdf_path, start, stop))
+    
+    @staticmethod
+    def _iter_pymupdf(pdf_path: Path, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield the text of each non-empty page in [start, stop) using PyMuPDF."""
+        import fitz  # PyMuPDF
         
         with fitz.open(str(pdf_path)) as doc:
-            for page_num, page in enumerate(doc, 1):
+            for page_num in range(start, len(doc) if stop is None else stop):
                 # Extract text from page
-                text = page.get_text()
+                text = doc[page_num].get_text()
                 if text.strip():
-                    text_parts.append(f"--- Page {page_num} ---\n{text}")
-        
-        return "\n\n".join(text_parts)
+                    yield f"--- Page {page_num + 1} ---\n{text}"
     
     @staticmethod
-    def _extract_with_pdfplumber(pdf_path: Path) -> str:
+    def _extract_with_pdfplumber(pdf_path: Path, workers: int = 1) -> str:
         """Extract text using pdfplumber."""
-        text_parts = []
+        if workers > 1:
+            import pdfplumber
+            
+            # pdfplumber is pure Python and holds the GIL, so use processes
+            with pdfplumber.open(str(pdf_path)) as pdf:
+                page_count = len(pdf.pages)
+            chunks = PDFHandler._iter_parallel(
+                PDFHandler._pdfplumber_page_range, pdf_path, page_count, workers
+            )
+        else:
+            chunks = PDFHandler._iter_pdfplumber(pdf_path)
+        return PDFHandler._join_chunks(chunks)
+    
+    @staticmethod
+    def _pdfplumber_page_range(pdf_path: Path, start: int, stop: int) -> List[str]:
+        """Extract pages [start, stop) with pdfplumber (runs in a worker process)."""
+        return list(PDFHandler._iter_pdfplumber(pdf_path, start, stop))
+    
+    @staticmethod
+    def _iter_pdfplumber(pdf_path: Path, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield the text and tables of each page in [start, stop) using pdfplumber."""
+        import pdfplumber
         
         with pdfplumber.open(str(pdf_path)) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
+            for page_num, page in enumerate(pdf.pages[start:stop], start + 1):
                 # Extract text from page
                 text = page.extract_text()
                 if text and text.strip():
-                    text_parts.append(f"--- Page {page_num} ---\n{text}")
+                    yield f"--- Page {page_num} ---\n{text}"
                 
                 # Also try to extract tables if present
                 tables = page.extract_tables()
@@ -91,15 +190,75 @@ class PDFHandler:
                     # Convert table to readable format
                     table_text = "\n".join(["\t".join(str(cell) if cell else "" for cell in row) for row in table])
                     if table_text.strip():
-                        text_parts.append(f"--- Table on Page {page_num} ---\n{table_text}")
-        
-        return "\n\n".join(text_parts)
+                        yield f"--- Table on Page {page_num} ---\n{table_text}"
     
     @staticmethod
     def is_pdf(file_path: Path) -> bool:
         """Check if file is a PDF based on extension."""
         return file_path.suffix.lower() == '.pdf'
     
+    @staticmethod
+    def preprocess_mode(file_path: Path) -> str:
+        """Pick preprocessing ("resume", "paper" or "raw") from file name hints."""
+        name = str(file_path).lower()
+        if "resume" in name or "cv" in name:
+            return "resume"
+        if "paper" in name or "article" in name:
+            return "paper"
+        return "raw"
+    
+    @staticmethod
+    def _cache_path(pdf_path: Path, mode: str) -> Path:
+        """Cache file for a PDF's extracted text, keyed on path, mtime and preprocessing."""
+        stat = pdf_path.stat()
+        key = hashlib.sha1(f"{pdf_path.resolve()}:{stat.st_mtime_ns}:{mode}".encode()).hexdigest()
+        return PDF_CACHE_DIR / f"v{PDF_CACHE_VERSION}_{key}.txt"
+    
+    @staticmethod
+    def load_input(input_path: Path) -> str:
+        """
+        Read an input file as text, extracting and preprocessing PDFs.
+        
+        PDF text is cached on disk, so unchanged PDFs are only parsed once.
+        
+        Args:
+            input_path: Path to a text or PDF file
+            
+        Returns:
+            Input text, preprocessed according to the file name for PDFs
+        """
+        if not PDFHandler.is_pdf(input_path):
+            return input_path.read_bytes().decode("utf-8")
+        
+        console = get_console()
+        mode = PDFHandler.preprocess_mode(input_path)
+        cache_path = PDFHandler._cache_path(input_path, mode)
+        if cache_path.exists():
+            console.print("[dim]Detected PDF file, using cached extracted text...[/dim]")
+            return cache_path.read_bytes().decode("utf-8")
+        
+        console.print("[dim]Detected PDF file, extracting text...[/dim]")
+        text = PDFHandler.extract_text(input_path)
+        
+        if mode == "resume":
+            console.print("[dim]Applying resume preprocessing...[/dim]")
+            text = PDFHandler.preprocess_resume(text)
+        elif mode == "paper":
+            console.print("[dim]Applying academic paper preprocessing...[/dim]")
+            text = PDFHandler.preprocess_academic_paper(text)
+        
+        # Write to a temp file and rename, so a concurrent run never
+        # reads a half-written cache file
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Caching is best effort
+        
+        return text
+    
     @staticmethod
     def preprocess_academic_paper(text: str) -> str:
         """
@@ -116,36 +275,40 @@ class PDFHandler:
         Returns:
             Cleaned text
         """
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        # Skip lines that are likely headers/footers (short, repeated)
-        seen_lines = {}
-        for line in lines:
-            line = line.strip()
-            if len(line) < 100:  # Short lines
-                if line in seen_lines:
-                    seen_lines[line] += 1
-                    if seen_lines[line] > 3:  # Skip if repeated more than 3 times
+        lines = list(map(str.strip, text.split('\n')))
+        
+        # Skip lines that are likely headers/footers (short, repeated):
+        # count all lines in one C-level pass, then only track the short ones
+        # that repeat more than 3 times, keeping their first 3 occurrences
+        counts = Counter(lines)
+        budget = {line: 3 for line, count in counts.items() if count > 3 and len(line) < 100}
+        if budget:
+            cleaned_lines = []
+            for line in lines:
+                remaining = budget.get(line)
+                if remaining is not None:
+                    if not remaining:
                         continue
-                else:
-                    seen_lines[line] = 1
-            
-            cleaned_lines.append(line)
+                    budget[line] = remaining - 1
+                cleaned_lines.append(line)
+        else:
+            cleaned_lines = lines
         
         # Join and clean up
         text = '\n'.join(cleaned_lines)
         
         # Optionally truncate references section if it's too long
         # (This is a simple heuristic - could be improved)
-        ref_markers = ['References', 'REFERENCES', 'Bibliography', 'BIBLIOGRAPHY']
-        for marker in ref_markers:
-            if marker in text:
-                parts = text.split(marker)
-                if len(parts) > 1 and len(parts[-1]) > len(parts[0]):
-                    # References section is longer than main content
-                    # Keep only first part of references
-                    text = parts[0] + marker + '\n' + parts[-1][:2000] + '\n... (references truncated)'
+        for marker in _REF_MARKERS:
+            first = text.find(marker)
+            if first == -1:
+                continue
+            # Text before the first marker vs. text after the last one
+            tail = text[text.rfind(marker) + len(marker):]
+            if len(tail) > first:
+                # References section is longer than main content
+                # Keep only first part of references
+                text = text[:first] + marker + '\n' + tail[:2000] + '\n... (references truncated)'
         
         return text
     
@@ -165,21 +328,18 @@ class PDFHandler:
         Returns:
             Cleaned text
         """
-        # Replace common bullet point characters
-        bullet_chars = ['•', '●', '○', '■', '□', '▪', '▫', '-', '*']
-        for char in bullet_chars:
-            text = text.replace(char, '• ')
-        
-        # Clean up excessive whitespace
-        lines = text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            if line:  # Keep non-empty lines
-                # Fix common OCR issues in resumes
-                line = line.replace('|', ' | ')  # Space around pipes
-                line = ' '.join(line.split())  # Normalize whitespace
-                cleaned_lines.append(line)
+        # Replace common bullet point characters, skipping the copy for
+        # styles the text does not use
+        for char in _BULLET_CHARS:
+            if char in text:
+                text = text.replace(char, '• ')
+        
+        # Fix common OCR issues in resumes: space around pipes (pipes never
+        # span lines, so one pass over the whole text is enough)
+        text = text.replace('|', ' | ')
+        
+        # Normalize whitespace and keep non-empty lines
+        normalized = (' '.join(line.split()) for line in text.split('\n'))
+        cleaned_lines = [line for line in normalized if line]
         
         return '\n'.join(cleaned_lines) 
\ No newline at end of file
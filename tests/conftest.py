@@ -0,0 +1,25 @@
+"""Shared pytest fixtures for the converter tests."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path for imports, like the scripts in the repo root
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import converter as converter_module
+
+
+@pytest.fixture
+def model_cache_dir(tmp_path, monkeypatch):
+    """Point the on-disk model cache at a per-test directory."""
+    cache_dir = tmp_path / "models"
+    monkeypatch.setattr(converter_module, "MODEL_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def converter(model_cache_dir):
+    """A converter with a dummy API key; tests never reach the API."""
+    return converter_module.UniversalTextToJSONConverter(api_key="test-key")
@@ -0,0 +1,206 @@
+"""Tests for packed convert_batch requests and the offline Batch API path."""
+
+import json
+import re
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+import converter as converter_module
+
+
+SCHEMA = {
+    "title": "Reading",
+    "type": "object",
+    "required": ["a"],
+    "properties": {"a": {"type": "integer"}},
+}
+
+
+def fake_create(calls):
+    """chat.completions.create stand-in answering every TEXT-<n> in the prompt with {"a": n}."""
+    def create(**kwargs):
+        prompt = kwargs["messages"][-1]["content"]
+        calls.append(prompt)
+        values = [int(n) for n in re.findall(r"TEXT-(\d+)", prompt)]
+        response_model = kwargs["response_model"]
+        if "items" in response_model.model_fields:
+            return response_model(items=[{"a": n} for n in values])
+        return response_model(a=values[0])
+    return create
+
+
+@pytest.fixture
+def calls(converter):
+    calls = []
+    converter.client.chat.completions.create = fake_create(calls)
+    return calls
+
+
+def test_texts_are_packed_into_batch_size_rows(converter, calls):
+    texts = [f"TEXT-{n}" for n in range(7)]
+    
+    results = converter.convert_batch(texts, SCHEMA, batch_size=3)
+    
+    assert results == [{"a": n} for n in range(7)]
+    assert len(calls) == 3
+    # Rows are numbered from 1 within each request, in input order
+    assert re.findall(r"--- ROW (\d+) ---\nTEXT-(\d+)", calls[1]) == [("1", "3"), ("2", "4"), ("3", "5")]
+    assert "Return exactly 3 items" in calls[0]
+
+
+def test_single_text_chunks_use_the_plain_extraction_prompt(converter, calls):
+    results = converter.convert_batch(["TEXT-0", "TEXT-1", "TEXT-2"], SCHEMA, batch_size=2)
+    
+    assert results == [{"a": 0}, {"a": 1}, {"a": 2}]
+    assert "--- ROW" in calls[0]
+    assert "--- ROW" not in calls[1]
+    assert calls[1] == converter._create_extraction_prompt("TEXT-2", SCHEMA)
+
+
+def test_batch_size_defaults_to_the_converter_setting(converter, calls):
+    converter.batch_size = 4
+    
+    assert converter.convert_batch([f"TEXT-{n}" for n in range(8)], SCHEMA) == [{"a": n} for n in range(8)]
+    assert len(calls) == 2
+
+
+def test_batch_models_require_exactly_one_item_per_row(converter):
+    model = converter._get_pydantic_model(SCHEMA)
+    batch_model = converter_module._get_batch_model(model, 2)
+    
+    assert batch_model is converter_module._get_batch_model(model, 2)
+    with pytest.raises(ValidationError):
+        batch_model(items=[{"a": 1}])
+    with pytest.raises(ValidationError):
+        batch_model(items=[{"a": 1}] * 3)
+
+
+class FakeOpenAI:
+    """Stands in for the files and batches clients used by convert_batch_api."""
+    
+    def __init__(self, statuses, output=b"", output_file_id="file-out"):
+        self.statuses = list(statuses)
+        self.output = output
+        self.output_file_id = output_file_id
+        self.uploads = []
+        self.retrieved = 0
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+    
+    def _batch(self, status):
+        output_file_id = self.output_file_id if status == "completed" else None
+        return SimpleNamespace(id="batch-1", status=status, output_file_id=output_file_id)
+    
+    def _upload(self, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file-in")
+    
+    def _create(self, input_file_id, endpoint, completion_window):
+        assert input_file_id == "file-in"
+        return self._batch(self.statuses.pop(0))
+    
+    def _retrieve(self, batch_id):
+        self.retrieved += 1
+        return self._batch(self.statuses.pop(0))
+    
+    def _content(self, file_id):
+        assert file_id == self.output_file_id
+        return SimpleNamespace(content=self.output)
+
+
+def result_line(custom_id, arguments=None, status_code=200, error=None):
+    """One line of a batch output file."""
+    body = {"choices": [{"message": {"tool_calls": [{"function": {"arguments": arguments}}]}}]}
+    record = {
+        "custom_id": custom_id,
+        "response": {"status_code": status_code, "body": body},
+        "error": error,
+    }
+    return json.dumps(record).encode()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(converter_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_batch_requests_are_built_as_forced_tool_calls(converter, sleeps):
+    converter.openai = FakeOpenAI(["completed"], output_file_id=None)
+    
+    converter.convert_batch_api(["TEXT-0", "TEXT-1"], SCHEMA)
+    
+    (name, payload), purpose = converter.openai.uploads[0]
+    assert (name, purpose) == ("batch.jsonl", "batch")
+    requests = [json.loads(line) for line in payload.split(b"\n")]
+    assert [r["custom_id"] for r in requests] == ["0", "1"]
+    
+    tool = converter_module._get_response_model(converter._get_pydantic_model(SCHEMA)).openai_schema
+    for request, text in zip(requests, ["TEXT-0", "TEXT-1"]):
+        assert (request["method"], request["url"]) == ("POST", "/v1/chat/completions")
+        body = request["body"]
+        assert body["model"] == converter.model
+        assert body["messages"] == converter._build_messages(converter._create_extraction_prompt(text, SCHEMA))
+        assert body["tools"] == [{"type": "function", "function": tool}]
+        assert body["tool_choice"] == {"type": "function", "function": {"name": tool["name"]}}
+
+
+def test_results_are_matched_by_custom_id(converter, sleeps):
+    output = b"\n".join([
+        result_line("2", '{"a": 2}'),
+        b"",
+        result_line("0", '{"a": 0}'),
+        result_line("1", '{"a": 1}'),
+    ])
+    converter.openai = FakeOpenAI(["validating", "in_progress", "finalizing", "completed"], output)
+    
+    results = converter.convert_batch_api(["TEXT-0", "TEXT-1", "TEXT-2"], SCHEMA,
+                                          poll_interval=1, max_poll_interval=3)
+    
+    assert results == [{"a": 0}, {"a": 1}, {"a": 2}]
+    # Exponential poll backoff, capped at max_poll_interval
+    assert sleeps == [1, 2, 3]
+    assert converter.openai.retrieved == 3
+
+
+def test_failed_and_invalid_requests_are_returned_as_errors(converter, sleeps):
+    output = b"\n".join([
+        result_line("0", '{"a": 0}'),
+        result_line("1", status_code=500, error={"message": "server error"}),
+        result_line("2", '{"a": "not a number"}'),
+        result_line("3", "not json"),
+        json.dumps({"custom_id": "4", "response": {"status_code": 200, "body": {"choices": []}}}).encode(),
+    ])
+    converter.openai = FakeOpenAI(["completed"], output)
+    
+    results = converter.convert_batch_api([f"TEXT-{n}" for n in range(6)], SCHEMA)
+    
+    assert results[0] == {"a": 0}
+    assert all(isinstance(result, ValueError) for result in results[1:])
+    assert "Request 1 failed" in str(results[1]) and "server error" in str(results[1])
+    for i in (2, 3, 4):
+        assert f"Request {i} returned an invalid result" in str(results[i])
+    # Requests missing from the output file
+    assert "No result returned for request 5" in str(results[5])
+
+
+def test_missing_output_file_marks_every_request_as_missing(converter, sleeps):
+    converter.openai = FakeOpenAI(["completed"], output_file_id=None)
+    
+    results = converter.convert_batch_api(["TEXT-0", "TEXT-1"], SCHEMA)
+    
+    assert [str(result) for result in results] == [
+        "No result returned for request 0",
+        "No result returned for request 1",
+    ]
+
+
+@pytest.mark.parametrize("status", ["failed", "expired", "cancelled"])
+def test_unfinished_batches_raise(converter, sleeps, status):
+    converter.openai = FakeOpenAI(["in_progress", status])
+    
+    with pytest.raises(RuntimeError, match=f"Batch batch-1 ended with status '{status}'"):
+        converter.convert_batch_api(["TEXT-0"], SCHEMA)
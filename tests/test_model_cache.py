@@ -0,0 +1,133 @@
+"""Tests for generated model sources and the on-disk model cache."""
+
+from typing import List
+
+import pytest
+
+import converter as converter_module
+from converter import _load_model_source, _model_source
+
+
+ADDRESS = {
+    "type": "object",
+    "required": ["city"],
+    "properties": {
+        "city": {"type": "string", "description": "City name"},
+        "zip-code": {"type": "string"},
+    },
+}
+
+SCHEMA = {
+    "title": "Person Record",
+    "type": "object",
+    "required": ["name", "class"],
+    "properties": {
+        "name": {"type": "string", "description": "Full name, e.g. \"Ada\""},
+        "class": {"type": "string", "description": "A Python keyword as field name"},
+        "List": {"type": "integer", "description": "Shadows a typing helper"},
+        "$schema": {"type": "string"},
+        "_id": {"type": "string"},
+        "2fa": {"type": "boolean"},
+        "status": {"type": "string", "enum": ["active", "on-leave", "it's complicated"]},
+        "score": {"type": "number"},
+        "nothing": {"type": "null"},
+        "home": ADDRESS,
+        "work": ADDRESS,
+        "tags": {"type": "array", "items": {"type": "string", "enum": ["a", "b"]}},
+        "jobs": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "office": ADDRESS,
+                },
+            },
+        },
+        "contact": {
+            "type": "union",
+            "oneOf": [{"type": "string"}, {"type": "object", "properties": {"phone": {"type": "string"}}}],
+        },
+    },
+}
+
+
+def test_source_round_trip_matches_built_model(converter, tmp_path):
+    model = converter._create_model_from_schema(SCHEMA)
+    path = tmp_path / "model.py"
+    path.write_text(_model_source(model), encoding="utf-8")
+    
+    reloaded = _load_model_source(path)
+    
+    assert reloaded.__name__ == model.__name__
+    assert reloaded.model_json_schema() == model.model_json_schema()
+    assert list(reloaded.model_fields) == list(model.model_fields)
+
+
+def test_round_trip_keeps_aliases_and_shared_models(converter, tmp_path):
+    model = converter._create_model_from_schema(SCHEMA)
+    path = tmp_path / "model.py"
+    path.write_text(_model_source(model), encoding="utf-8")
+    reloaded = _load_model_source(path)
+    
+    # Identical sub-objects share one nested model in both versions
+    assert reloaded.model_fields["home"].annotation is reloaded.model_fields["work"].annotation
+    
+    data = {
+        "name": "Ada",
+        "class": "x",
+        "$schema": "s",
+        "_id": "1",
+        "2fa": True,
+        "status": "it's complicated",
+        "home": {"city": "London", "zip-code": "N1"},
+    }
+    assert reloaded.model_validate(data).model_dump(by_alias=True) == \
+        model.model_validate(data).model_dump(by_alias=True)
+
+
+def test_disk_cache_is_used_by_a_new_converter(converter, model_cache_dir, monkeypatch):
+    model = converter._get_pydantic_model(SCHEMA)
+    assert len(list(model_cache_dir.glob("*.py"))) == 1
+    
+    fresh = converter_module.UniversalTextToJSONConverter(api_key="test-key")
+    
+    def fail(schema):
+        raise AssertionError("model should come from the disk cache")
+    
+    monkeypatch.setattr(fresh, "_create_model_from_schema", fail)
+    cached = fresh._get_pydantic_model(SCHEMA)
+    assert cached.model_json_schema() == model.model_json_schema()
+
+
+def test_corrupt_cache_file_is_rebuilt(converter, model_cache_dir):
+    converter._get_pydantic_model(SCHEMA)
+    (cache_file,) = model_cache_dir.glob("*.py")
+    cache_file.write_text("this is not python", encoding="utf-8")
+    
+    fresh = converter_module.UniversalTextToJSONConverter(api_key="test-key")
+    model = fresh._get_pydantic_model(SCHEMA)
+    
+    assert model.__name__ == "Person_Record"
+    _load_model_source(cache_file)  # rewritten with valid source
+
+
+def test_unknown_annotation_is_rejected():
+    from pydantic import create_model
+    
+    with pytest.raises(TypeError):
+        _model_source(create_model("Odd", when=(dict, None)))
+
+
+def test_type_arrays_build_as_strings(converter):
+    schema = {
+        "title": "Nullable",
+        "properties": {
+            "nickname": {"type": ["string", "null"]},
+            "tags": {"type": "array", "items": {"type": ["integer", "string"]}},
+        },
+    }
+    model = converter._create_model_from_schema(schema)
+    
+    assert model.model_fields["nickname"].annotation is str
+    assert model.model_fields["tags"].annotation == List[str]
@@ -0,0 +1,87 @@
+"""Tests for loading inputs through PDFHandler and the PDF text cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import pdf_handler
+from pdf_handler import PDFHandler
+
+
+@pytest.fixture
+def pdf_cache_dir(tmp_path, monkeypatch):
+    """Point the extracted-text cache at a per-test directory."""
+    cache_dir = tmp_path / "pdf-cache"
+    monkeypatch.setattr(pdf_handler, "PDF_CACHE_DIR", cache_dir)
+    return cache_dir
+
+
+@pytest.fixture
+def extract_calls(monkeypatch):
+    """Replace PDF extraction with a stub and record each path it is called with."""
+    calls = []
+    
+    def extract_text(pdf_path, method="auto", workers=1):
+        calls.append(pdf_path)
+        return "line one\n\n   line   two  "
+    
+    monkeypatch.setattr(PDFHandler, "extract_text", staticmethod(extract_text))
+    return calls
+
+
+@pytest.mark.parametrize("name, mode", [
+    ("Jane_Resume.pdf", "resume"),
+    ("cv.pdf", "resume"),
+    ("conference-paper.pdf", "paper"),
+    ("news_article.pdf", "paper"),
+    ("invoice.pdf", "raw"),
+])
+def test_preprocess_mode_follows_file_name(name, mode):
+    assert PDFHandler.preprocess_mode(Path(name)) == mode
+
+
+def test_text_inputs_skip_extraction_and_cache(tmp_path, pdf_cache_dir, extract_calls):
+    path = tmp_path / "notes.txt"
+    path.write_bytes("héllo\n".encode("utf-8"))
+    
+    assert PDFHandler.load_input(path) == "héllo\n"
+    assert extract_calls == []
+    assert not pdf_cache_dir.exists()
+
+
+def test_pdf_text_is_preprocessed_and_cached(tmp_path, pdf_cache_dir, extract_calls):
+    path = tmp_path / "resume.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    
+    first = PDFHandler.load_input(path)
+    assert first == PDFHandler.preprocess_resume("line one\n\n   line   two  ")
+    assert PDFHandler.load_input(path) == first
+    assert extract_calls == [path]
+    
+    # One complete cache file, no leftover temp files
+    assert [p.suffix for p in pdf_cache_dir.iterdir()] == [".txt"]
+
+
+def test_touching_a_pdf_invalidates_its_cache_entry(tmp_path, pdf_cache_dir, extract_calls):
+    raw = tmp_path / "scan.pdf"
+    raw.write_bytes(b"%PDF-1.4")
+    assert PDFHandler.load_input(raw) == "line one\n\n   line   two  "
+    
+    # A new mtime means a new cache key, so the PDF is extracted again
+    stat = raw.stat()
+    os.utime(raw, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    PDFHandler.load_input(raw)
+    assert extract_calls == [raw, raw]
+    assert len(list(pdf_cache_dir.iterdir())) == 2
+
+
+def test_unwritable_cache_is_ignored(tmp_path, monkeypatch, extract_calls):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    monkeypatch.setattr(pdf_handler, "PDF_CACHE_DIR", blocker / "cache")
+    path = tmp_path / "paper.pdf"
+    path.write_bytes(b"%PDF-1.4")
+    
+    assert PDFHandler.load_input(path) == PDFHandler.load_input(path)
+    assert len(extract_calls) == 2
@@ -0,0 +1,170 @@
+"""Tests for the client-side rate limiter and 429 handling."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from openai import RateLimitError
+from pydantic import BaseModel
+
+import converter as converter_module
+from converter import TokenBucket
+
+
+class FakeClock:
+    """Stands in for time.monotonic() and time.sleep() in the converter module."""
+    
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+    
+    def monotonic(self):
+        return self.now
+    
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock; request it before `converter` so the bucket starts on it."""
+    fake = FakeClock()
+    monkeypatch.setattr(converter_module.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(converter_module.time, "sleep", fake.sleep)
+    return fake
+
+
+def rate_limit_error():
+    response = SimpleNamespace(request=None, status_code=429, headers={})
+    return RateLimitError("rate limited", response=response, body=None)
+
+
+def test_full_bucket_does_not_wait(clock):
+    bucket = TokenBucket(rpm=60, tpm=1000)
+    assert bucket.reserve(400) == 0
+    assert bucket.reserve(600) == 0
+
+
+def test_token_shortfall_waits_until_refilled(clock):
+    bucket = TokenBucket(rpm=1000, tpm=600)
+    assert bucket.reserve(600) == 0
+    # 300 tokens short at 600 tokens/minute
+    assert bucket.reserve(300) == pytest.approx(30)
+    # Queued callers wait for the debt of everyone ahead of them
+    assert bucket.reserve(300) == pytest.approx(60)
+
+
+def test_request_shortfall_waits_until_refilled(clock):
+    bucket = TokenBucket(rpm=60, tpm=10 ** 9)
+    for _ in range(60):
+        assert bucket.reserve(1) == 0
+    assert bucket.reserve(1) == pytest.approx(1)
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucket(rpm=1000, tpm=600)
+    bucket.reserve(600)
+    clock.now += 30  # half a minute refills half the budget
+    assert bucket.reserve(300) == 0
+    assert bucket.reserve(300) == pytest.approx(30)
+
+
+def test_refill_is_capped_at_the_budget(clock):
+    bucket = TokenBucket(rpm=1000, tpm=600)
+    clock.now += 3600
+    assert bucket.reserve(600) == 0
+    assert bucket.reserve(600) == pytest.approx(60)
+
+
+def test_request_larger_than_budget_waits_for_a_full_bucket(clock):
+    bucket = TokenBucket(rpm=1000, tpm=1000)
+    # Capped at the whole budget instead of waiting forever
+    assert bucket.reserve(5000) == 0
+    assert bucket.reserve(5000) == pytest.approx(60)
+    
+    bucket = TokenBucket(rpm=1000, tpm=1000)
+    bucket.reserve(500)
+    assert bucket.reserve(5000) == pytest.approx(30)
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_non_positive_limits_disable_that_budget(clock, limit):
+    bucket = TokenBucket(rpm=limit, tpm=600)
+    # Any number of requests, only tokens are limited
+    assert all(bucket.reserve(0) == 0 for _ in range(100))
+    assert bucket.reserve(600) == 0
+    assert bucket.reserve(600) == pytest.approx(60)
+    
+    bucket = TokenBucket(rpm=60, tpm=limit)
+    assert bucket.reserve(10 ** 9) == 0
+    
+    bucket = TokenBucket(rpm=limit, tpm=limit)
+    assert all(bucket.reserve(10 ** 9) == 0 for _ in range(1000))
+
+
+def test_acquire_sleeps_for_the_reserved_wait(clock):
+    bucket = TokenBucket(rpm=1000, tpm=600)
+    bucket.acquire(600)
+    bucket.acquire(300)
+    assert clock.sleeps == [pytest.approx(30)]
+
+
+def test_aacquire_awaits_the_reserved_wait(clock, monkeypatch):
+    waits = []
+    
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+    
+    monkeypatch.setattr(converter_module.asyncio, "sleep", fake_sleep)
+    bucket = TokenBucket(rpm=1000, tpm=600)
+    
+    async def run():
+        await bucket.aacquire(600)
+        await bucket.aacquire(300)
+    
+    asyncio.run(run())
+    assert waits == [pytest.approx(30)]
+
+
+class Item(BaseModel):
+    a: int
+
+
+def fake_create(calls, failures):
+    """chat.completions.create stand-in raising the given errors first."""
+    def create(**kwargs):
+        calls.append(kwargs["model"])
+        if len(calls) <= len(failures):
+            raise failures[len(calls) - 1]
+        return Item(a=1)
+    return create
+
+
+def test_rate_limited_request_is_retried_on_the_same_model(clock, converter):
+    calls = []
+    converter.client.chat.completions.create = fake_create(calls, [rate_limit_error()] * 2)
+    
+    assert converter._complete("prompt", Item) == Item(a=1)
+    assert calls == ["gpt-4.1"] * 3
+    assert len(clock.sleeps) == 2
+
+
+def test_wrapped_rate_limit_does_not_fall_back(clock, converter):
+    # Instructor wraps API errors, keeping the original as __cause__
+    wrapped = Exception("retries exhausted")
+    wrapped.__cause__ = rate_limit_error()
+    calls = []
+    converter.client.chat.completions.create = fake_create(calls, [wrapped] * 10)
+    
+    with pytest.raises(Exception, match="retries exhausted"):
+        converter._complete("prompt", Item)
+    assert set(calls) == {"gpt-4.1"}
+    assert len(calls) == converter.max_retries + 1
+
+
+def test_other_errors_fall_back_to_gpt_4o(clock, converter):
+    calls = []
+    converter.client.chat.completions.create = fake_create(calls, [ValueError("model not found")])
+    
+    assert converter._complete("prompt", Item) == Item(a=1)
+    assert calls == ["gpt-4.1", "gpt-4o"]